@@ -43,7 +43,7 @@ def astype(
     dtype: dtype
         desired data type.
     copy: bool
-        specifies whether to copy an array when the specified ``dtype`` matches the data type of the input array ``x``. If ``True``, a newly allocated array must always be returned (see :ref:`copy-keyword-argument`). If ``False`` and the specified ``dtype`` matches the data type of the input array, the input array must be returned; otherwise, a newly allocated array must be returned. Default: ``True``.
+        specifies whether to copy an array when the specified ``dtype`` matches the data type of the input array ``x``. If ``True``, a newly allocated array must always be returned (see :ref:`copy-keyword-argument`). If ``False``, the specified ``dtype`` matches the data type of the input array, and ``device`` is either ``None`` or equal to the device of the input array, the input array must be returned without copying or otherwise accessing its underlying data; otherwise, a newly allocated array must be returned. Default: ``True``.
     device: Optional[device]
         device on which to place the returned array. If ``device`` is ``None``, the output array device must be inferred from ``x``. Default: ``None``.
 
@@ -84,6 +84,7 @@ def can_cast(from_: Union[dtype, array], to: dtype, /) -> bool:
 
     -   When ``from_`` is a data type, the function must determine whether the data type can be cast to another data type according to the complete type promotion rules (see :ref:`type-promotion`) described in this specification, irrespective of whether a conforming array library supports devices which do not have full data type support.
     -   When ``from_`` is an array, the function must determine whether the data type of the array can be cast to the desired data type according to the type promotion graph of the array device. As not all devices can support all data types, full support for type promotion rules (see :ref:`type-promotion`) may not be possible. Accordingly, the output of ``can_cast(array, dtype)`` may differ from ``can_cast(array.dtype, dtype)``.
+    -   The output must depend only on the data type of ``from_``, the desired data type ``to``, and, when ``from_`` is an array, the device of ``from_``. In particular, the output must not depend on the values, shape, or other properties of an input array.
 
     .. versionchanged:: 2024.12
        Required that the application of type promotion rules must account for device context.
@@ -136,6 +137,8 @@ def finfo(type: Union[dtype, array], /) -> finfo_object:
     Notes
     -----
 
+    -   The attributes of the returned object depend only on the data type of ``type``. Conforming implementations may return the same object for repeated calls having the same data type. Accordingly, array library consumers must not modify the returned object.
+
     .. versionchanged:: 2022.12
        Added complex data type support.
     """
@@ -172,6 +175,11 @@ def iinfo(type: Union[dtype, array], /) -> iinfo_object:
           integer data type.
 
           .. versionadded:: 2022.12
+
+    Notes
+    -----
+
+    -   The attributes of the returned object depend only on the data type of ``type``. Conforming implementations may return the same object for repeated calls having the same data type. Accordingly, array library consumers must not modify the returned object.
     """
 
 
@@ -201,6 +209,8 @@ def isdtype(
 
         -   If ``kind`` is a tuple, the tuple specifies a union of dtypes and/or kinds, and the function must return a boolean indicating whether the input ``dtype`` is either equal to a specified dtype or belongs to at least one specified data type kind.
 
+        A dtype must belong to at most one of the ``'bool'``, ``'signed integer'``, ``'unsigned integer'``, ``'real floating'``, and ``'complex floating'`` data type kinds. The ``'integral'`` and ``'numeric'`` data type kinds are exactly the unions of the kinds for which they are shorthand.
+
         .. note::
            A conforming implementation of the array API standard is **not** limited to only including the dtypes described in this specification in the required data type kinds. For example, implementations supporting ``float16`` and ``bfloat16`` can include ``float16`` and ``bfloat16`` in the ``real floating`` data type kind. Similarly, implementations supporting ``int128`` can include ``int128`` in the ``signed integer`` data type kind.
 
@@ -239,6 +249,8 @@ def result_type(
 
     -   At least one argument must be an array or a dtype.
     -   If provided array and/or dtype arguments having mixed data type kinds (e.g., integer and floating-point), the returned dtype is unspecified and thus implementation-dependent.
+    -   Where defined by the type promotion rules (see :ref:`type-promotion`), promotion between two dtypes is given by their join on the type promotion lattice. As noted for the type promotion diagram, promotion between dtypes having mixed data type kinds is undefined, and not every pair of dtypes having the same data type kind has a join (e.g., ``int64`` and ``uint64``). Accordingly, when provided array and/or dtype arguments which do not have mixed data type kinds and for which promotion is defined, the returned dtype must be the join of the data types of those arguments on a single type promotion graph (i.e., the type promotion graph of the array device if at least one argument is an array; otherwise, the complete type promotion graph) and must not depend on the order of the arguments.
+    -   Python scalar arguments must not affect promotion among array and/or dtype arguments. The function must first determine the dtype resulting from the array and/or dtype arguments and must then apply each scalar argument to that dtype according to the rules for mixing arrays with Python scalars (see :ref:`mixing-scalars-and-arrays`). Accordingly, the position of a scalar argument must not affect the returned dtype.
     -   If at least one argument is an array, the function must determine the resulting dtype according to the type promotion graph of the array device which is shared among all array arguments. As not all devices can support all data types, full support for type promotion rules (see :ref:`type-promotion`) may not be possible. Accordingly, the returned dtype may differ from that determined from the complete type promotion graph defined in this specification (see :ref:`type-promotion`).
     -   If two or more arguments are arrays belonging to different devices, behavior is unspecified and thus implementation-dependent. Conforming implementations may choose to ignore device attributes, raise an exception, or some other behavior.
 
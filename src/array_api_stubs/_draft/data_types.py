@@ -19,4 +19,10 @@ def __eq__(self: dtype, other: dtype, /) -> bool:
     -------
     out: bool
         a boolean indicating whether the data type objects are equal.
+
+    Notes
+    -----
+
+    -   The data type objects provided in the main namespace and returned by the ``dtype`` attribute of an array object should be hashable, and such data type objects which compare equal should have equal hash values (see :ref:`data-types`).
+    -   Conforming implementations are recommended to represent each supported data type by a single data type object, such that data type object equality is equivalent to object identity. However, array library consumers should not rely on object identity (e.g., ``x.dtype is float32``) and should test for data type object equality using ``==``. Array library consumers should also be aware that other objects which compare equal to a data type object (e.g., alternative data type specifiers accepted by an implementation) may have different hash values.
     """